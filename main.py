@@ -1,11 +1,18 @@
 import sys
 import math
+from collections import OrderedDict
+
+import numpy as np
+from numba import njit, prange
 
 from PyQt5.QtCore import (
     Qt,
     QTimer,
     QPointF,
     QRectF,
+    QObject,
+    QRunnable,
+    QThreadPool,
     pyqtSignal,
 )
 from PyQt5.QtGui import (
@@ -13,9 +20,9 @@ from PyQt5.QtGui import (
     QPixmap,
     QPen,
     QPainterPath,
+    QPolygonF,
     QTransform,
     QImage,
-    QColor,
 )
 from PyQt5.QtWidgets import (
     QApplication,
@@ -34,6 +41,256 @@ from PyQt5.QtWidgets import (
 )
 
 
+_TILE = 16  # output tile edge for the sampler (keeps source rows cache-hot)
+_SRC_TILE_SHIFT = 6                   # source image stored in 64x64 tiles...
+_SRC_TILE = 1 << _SRC_TILE_SHIFT      # ...16 KiB each, see _to_tiles
+_CROP_CACHE_MAX = 64                  # max number of cached camera views
+_CROP_CACHE_BYTES = 64 * 1024 * 1024  # ...and their total size
+_PRECOMPUTE_BYTES = 256 * 1024 * 1024  # max size of a whole-path crop cache
+_MIN_POINT_SPACING_PX = 2  # closer mouse samples (Manhattan) are dropped
+
+
+def _to_tiles(src: np.ndarray) -> np.ndarray:
+    """
+    Re-lay an (H, W, 4) image as (H/T, W/T, T, T, 4) tiles of _SRC_TILE
+    pixels (edges zero-padded), so a rotated window touches a few compact
+    blocks of memory instead of many long image rows. Filled one band of
+    tile rows at a time, so src can be a view and no padded copy is made.
+    """
+    t = _SRC_TILE
+    h, w = src.shape[:2]
+    n_ty = (h + t - 1) // t
+    n_tx = (w + t - 1) // t
+    n_full = w // t
+    tiles = np.zeros((n_ty, n_tx, t, t, 4), dtype=np.uint8)
+    for ty in range(n_ty):
+        band = src[ty * t:(ty + 1) * t]
+        r = len(band)
+        tiles[ty, :n_full, :r] = band[:, :n_full * t].reshape(r, n_full, t, 4).transpose(1, 0, 2, 3)
+        if n_full < n_tx:
+            tiles[ty, n_full, :r, :w - n_full * t] = band[:, n_full * t:]
+    return tiles
+
+
+@njit(inline="always")
+def _texel(tiles, iy, ix, c):
+    """Channel c of image pixel (ix, iy) in the tiled layout."""
+    m = _SRC_TILE - 1
+    return tiles[iy >> _SRC_TILE_SHIFT, ix >> _SRC_TILE_SHIFT, iy & m, ix & m, c]
+
+
+@njit(inline="always")
+def _blend_pixel(tiles, out, y, x, gx, gy):
+    """Bilinear sample of the tiled image at (gx, gy) into out[y, x]; no bounds check."""
+    ix0 = int(math.floor(gx))
+    iy0 = int(math.floor(gy))
+    fx = gx - ix0
+    fy = gy - iy0
+    w00 = (1.0 - fx) * (1.0 - fy)
+    w01 = fx * (1.0 - fy)
+    w10 = (1.0 - fx) * fy
+    w11 = fx * fy
+    for c in range(4):
+        a = (_texel(tiles, iy0, ix0, c) * w00 + _texel(tiles, iy0, ix0 + 1, c) * w01
+             + _texel(tiles, iy0 + 1, ix0, c) * w10 + _texel(tiles, iy0 + 1, ix0 + 1, c) * w11)
+        out[y, x, c] = np.uint8(a + 0.5)
+
+
+@njit(inline="always")
+def _sample_tile_row(tiles, out, cx, cy, cos_t, sin_t, w, h, W, H, ty):
+    """Sample output rows [ty * _TILE, (ty + 1) * _TILE) block by block."""
+    n_tx = (w + _TILE - 1) // _TILE
+    y0 = ty * _TILE
+    y1 = min(y0 + _TILE, h)
+    for tx in range(n_tx):
+        x0 = tx * _TILE
+        x1 = min(x0 + _TILE, w)
+
+        # source-side bounding box of the block (affine -> corners suffice),
+        # seeded from the first corner: fastmath assumes no infinities
+        ly0 = y0 - h * 0.5
+        lx0 = x0 - w * 0.5
+        gx_min = gx_max = cx + cos_t * lx0 - sin_t * ly0
+        gy_min = gy_max = cy + sin_t * lx0 + cos_t * ly0
+        for ly in (ly0, y1 - 1 - h * 0.5):
+            for lx in (lx0, x1 - 1 - w * 0.5):
+                gx = cx + cos_t * lx - sin_t * ly
+                gy = cy + sin_t * lx + cos_t * ly
+                gx_min = min(gx_min, gx)
+                gx_max = max(gx_max, gx)
+                gy_min = min(gy_min, gy)
+                gy_max = max(gy_max, gy)
+        # one pixel of margin absorbs rounding differences
+        inside = (gx_min >= 1.0 and gx_max < W - 2.0
+                  and gy_min >= 1.0 and gy_max < H - 2.0)
+
+        for y in range(y0, y1):
+            ly = y - h * 0.5
+            for x in range(x0, x1):
+                lx = x - w * 0.5
+
+                # local -> world (image) coordinates
+                gx = cx + cos_t * lx - sin_t * ly
+                gy = cy + sin_t * lx + cos_t * ly
+
+                if inside or (0.0 <= gx < W - 1 and 0.0 <= gy < H - 1):
+                    _blend_pixel(tiles, out, y, x, gx, gy)
+                else:
+                    out[y, x, 0] = 0
+                    out[y, x, 1] = 0
+                    out[y, x, 2] = 0
+                    out[y, x, 3] = 255
+
+
+@njit(parallel=True, nogil=True, fastmath=True, cache=True)
+def _sample_rotated(tiles, out, cx, cy, cos_t, sin_t, w, h, W, H):
+    """
+    Fill out[h, w, 4] with the rotated window, centred at (cx, cy), of the
+    W x H image stored as tiles (see _to_tiles), with bilinear sampling.
+    Pixels outside the image become opaque black.
+
+    The output is walked in _TILE x _TILE blocks so each block reads a small
+    patch of the image; blocks that map fully inside it skip the bounds check.
+    """
+    for ty in prange((h + _TILE - 1) // _TILE):
+        _sample_tile_row(tiles, out, cx, cy, cos_t, sin_t, w, h, W, H, ty)
+
+
+@njit(nogil=True, fastmath=True, cache=True)
+def _sample_rotated_serial(tiles, out, cx, cy, cos_t, sin_t, w, h, W, H):
+    """
+    Single-threaded _sample_rotated for background workers, so it never
+    competes with the parallel version for numba's thread pool.
+    """
+    for ty in range((h + _TILE - 1) // _TILE):
+        _sample_tile_row(tiles, out, cx, cy, cos_t, sin_t, w, h, W, H, ty)
+
+
+def _copy_axis_aligned(tiles, out, cx, cy, cos_t, sin_t, img_w, img_h) -> bool:
+    """
+    Fast path for headings of 0/90/180/270 degrees whose window lands on
+    whole pixels: the view is then a plain (flipped/transposed) block
+    copy of the source. Returns False if the general sampler is needed.
+    """
+    h, w = out.shape[:2]
+    if abs(sin_t) < 1e-9:
+        if cos_t > 0:
+            x0, y0, dst = cx - w / 2, cy - h / 2, out
+        else:
+            x0, y0, dst = cx + w / 2 - (w - 1), cy + h / 2 - (h - 1), out[::-1, ::-1]
+    elif abs(cos_t) < 1e-9:
+        # rows of the source window run along the output's columns
+        if sin_t > 0:
+            x0, y0 = cx + h / 2 - (h - 1), cy - w / 2
+            dst = out[::-1].transpose(1, 0, 2)
+        else:
+            x0, y0 = cx - h / 2, cy + w / 2 - (w - 1)
+            dst = out[:, ::-1].transpose(1, 0, 2)
+    else:
+        return False
+    if not (float(x0).is_integer() and float(y0).is_integer()):
+        return False
+
+    # same valid area as the bilinear sampler (needs a 2x2 neighbourhood)
+    x0, y0 = int(x0), int(y0)
+    dh, dw = dst.shape[:2]
+    sx0, sy0 = max(x0, 0), max(y0, 0)
+    sx1, sy1 = min(x0 + dw, img_w - 1), min(y0 + dh, img_h - 1)
+
+    dst[...] = (0, 0, 0, 255)  # opaque black outside image bounds
+    if sx0 >= sx1 or sy0 >= sy1:
+        return True
+    # copy the window tile by tile
+    t = _SRC_TILE
+    for ty in range(sy0 // t, (sy1 - 1) // t + 1):
+        ya, yb = max(sy0, ty * t), min(sy1, (ty + 1) * t)
+        for tx in range(sx0 // t, (sx1 - 1) // t + 1):
+            xa, xb = max(sx0, tx * t), min(sx1, (tx + 1) * t)
+            dst[ya - y0:yb - y0, xa - x0:xb - x0] = \
+                tiles[ty, tx, ya - ty * t:yb - ty * t, xa - tx * t:xb - tx * t]
+    return True
+
+
+def _render_view(tiles, img_size, out, cx, cy, cos_t, sin_t, sampler=_sample_rotated):
+    """
+    Render the camera view centred at (cx, cy) with the given heading into
+    out, from the img_size = (W, H) image stored as tiles.
+    """
+    img_w, img_h = img_size
+    if not _copy_axis_aligned(tiles, out, cx, cy, cos_t, sin_t, img_w, img_h):
+        h, w = out.shape[:2]
+        # the sampler writes every pixel, so out needs no clearing
+        sampler(tiles, out, cx, cy, cos_t, sin_t, w, h, img_w, img_h)
+
+
+class _PrecomputedCrops:
+    """
+    Camera views for every index of a path, in one (N, h, w, 4) array,
+    filled in by _CropPrecompute; crops[:done] are ready to show.
+    """
+
+    def __init__(self, n, w, h):
+        self.crops = np.empty((n, h, w, 4), dtype=np.uint8)
+        self.done = 0
+        self.cancelled = False
+
+
+class _CropPrecompute(QRunnable):
+    """
+    Background task that fills a _PrecomputedCrops. The pool owns and
+    deletes the task; the canvas only keeps the result object.
+    """
+
+    def __init__(self, result, tiles, img_size, pts, cos, sin):
+        super().__init__()
+        self.result = result
+        self.tiles = tiles
+        self.img_size = img_size
+        self.pts = pts
+        self.cos = cos
+        self.sin = sin
+
+    def run(self):
+        result = self.result
+        for i in range(len(result.crops)):
+            if result.cancelled:
+                return
+            cx, cy = self.pts[i].tolist()
+            _render_view(self.tiles, self.img_size, result.crops[i], cx, cy,
+                         float(self.cos[i]), float(self.sin[i]),
+                         _sample_rotated_serial)
+            result.done = i + 1
+
+
+class _RenderSignals(QObject):
+    rendered = pyqtSignal(int, int, object)  # (generation, seq, cache key)
+
+
+class _CropRender(QRunnable):
+    """
+    Background task that renders one camera view into a reusable buffer
+    and reports back through its own signals object, so a canvas deleted
+    meanwhile just misses the (auto-disconnected) signal.
+    """
+
+    def __init__(self, tiles, img_size, out, generation, seq, key, cx, cy, cos_t, sin_t):
+        super().__init__()
+        self.signals = _RenderSignals()
+        self.tiles = tiles
+        self.img_size = img_size
+        self.out = out
+        self.generation = generation
+        self.seq = seq
+        self.key = key
+        self.view = (cx, cy, cos_t, sin_t)
+
+    def run(self):
+        # numba releases the GIL here, so the GUI thread keeps running
+        _render_view(self.tiles, self.img_size, self.out, *self.view)
+        # emitted from this thread -> delivered queued on the GUI thread
+        self.signals.rendered.emit(self.generation, self.seq, self.key)
+
+
 class ImageCanvas(QWidget):
     """
     Widget that:
@@ -48,8 +305,23 @@ class ImageCanvas(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.image = None           # QPixmap of the big (satellite) image
-        self.image_qimage = None    # QImage version for pixel access
-        self.path_points = []       # list of QPointF
+        self._src_tiles = None      # image pixels (BGRA) in 64x64 tiles, see _to_tiles
+        self._src_size = None       # (W, H) of the image in _src_tiles
+        self._pts = np.empty((1024, 2), dtype=np.float32)  # path (x, y) rows
+        self._n = 0                 # number of valid rows in _pts
+        self._path_layer = None     # QPixmap with the yellow path already stroked
+        # per-index heading cos/sin and quarter-degree bin, sized like _pts;
+        # only the first _n_headings entries are up to date
+        self._cos = np.empty(len(self._pts))
+        self._sin = np.empty(len(self._pts))
+        self._angle_keys = np.empty(len(self._pts), dtype=np.int64)
+        self._n_headings = 0
+        self._crop_cache = OrderedDict()  # (x, y, angle bin) -> QPixmap, LRU
+        self._precompute = None     # _PrecomputedCrops for the current path/size
+        self._render_busy = False   # a _CropRender is in flight
+        self._pending_render = None  # newest view requested while busy
+        self._generation = 0        # bumped when image/path/size change
+        self._view_seq = 0          # bumped for every view requested
         self.drawing = False        # is the mouse drawing a path?
         self.drone_index = 0        # current index on the path
         self.playing = False
@@ -58,15 +330,47 @@ class ImageCanvas(QWidget):
         self.rect_width_px = 80.0
         self.rect_height_px = 80.0
 
+        # reusable camera-view buffer, rebuilt only when the rect size changes
+        self._out_np = None
+        self._out_qimg = None
+        self._alloc_output_buffer()
+
         self.timer = QTimer(self)
         self.timer.timeout.connect(self._on_timer)
 
+        # Own pool for the background renders: Qt also uses the global pool
+        # to convert big images inside QPixmap.fromImage, and blocks on it
+        # with the GIL held; long numba tasks there can deadlock the GUI.
+        # One thread for the whole-path precompute, one for on-demand views.
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(2)
+        # drain it before widgets are torn down (waitForDone releases the GIL)
+        QApplication.instance().aboutToQuit.connect(self._shutdown_background)
+
     # ---------- public API ----------
 
     def setImage(self, pixmap: QPixmap):
         self.image = pixmap
-        self.image_qimage = pixmap.toImage() if not pixmap.isNull() else None
-        self.path_points.clear()
+        self._src_tiles = None
+        self._src_size = None
+        if not pixmap.isNull():
+            qimg = pixmap.toImage().convertToFormat(QImage.Format_ARGB32)
+            self._src_tiles = _to_tiles(self._qimage_view(qimg))
+            self._src_size = (qimg.width(), qimg.height())
+            # compile the samplers now so the first frame isn't delayed
+            # (only once: a render may already be running on a worker);
+            # cache=True turns later launches into a disk load. No
+            # numba.pycc build: its exports can't release the GIL.
+            for sampler in (_sample_rotated, _sample_rotated_serial):
+                if not sampler.signatures:
+                    sampler(self._src_tiles, np.empty((2, 2, 4), dtype=np.uint8),
+                            0.0, 0.0, 1.0, 0.0, 2, 2,
+                            *self._src_size)
+        self._n = 0
+        self._n_headings = 0
+        self._path_layer = None
+        self._crop_cache.clear()
+        self._cancel_background()
         self.drawing = False
         self.playing = False
         self.drone_index = 0
@@ -78,11 +382,12 @@ class ImageCanvas(QWidget):
         return self.image is not None
 
     def hasPath(self):
-        return len(self.path_points) > 1
+        return self._n > 1
 
     def setRectangleSizePixels(self, w_px: float, h_px: float):
         self.rect_width_px = max(4.0, float(w_px))
         self.rect_height_px = max(4.0, float(h_px))
+        self._alloc_output_buffer()
 
     def startAnimation(self, interval_ms: int):
         """
@@ -94,6 +399,7 @@ class ImageCanvas(QWidget):
 
         self.drone_index = 0
         self.playing = True
+        self._start_precompute()
         self._emit_crop()    # show first observing area immediately
         self.update()
         self.timer.start(max(1, int(interval_ms)))
@@ -101,6 +407,9 @@ class ImageCanvas(QWidget):
     def stopAnimation(self):
         self.timer.stop()
         self.playing = False
+        # no more views after Stop: drop the queued one, ignore the running one
+        self._pending_render = None
+        self._generation += 1
         self.update()
 
     # ---------- mouse events (draw path) ----------
@@ -113,7 +422,11 @@ class ImageCanvas(QWidget):
             pos = event.pos()
             if self._point_in_image(pos):
                 # Start new path
-                self.path_points = [QPointF(pos)]
+                self._n = 0
+                self._append_point(pos.x(), pos.y())
+                self._cancel_background()
+                self._path_layer = QPixmap(self.image.size())
+                self._path_layer.fill(Qt.transparent)
                 self.drawing = True
                 self.drone_index = 0
                 self.playing = False
@@ -124,12 +437,23 @@ class ImageCanvas(QWidget):
         if not self.drawing or not self.hasImage():
             return
         pos = event.pos()
-        if self._point_in_image(pos):
-            self.path_points.append(QPointF(pos))
-            self.update()
+        # outside the image: follow along its edge instead of dropping events
+        x = min(max(pos.x(), 0), self.image.width() - 1)
+        y = min(max(pos.y(), 0), self.image.height() - 1)
+        last_x, last_y = self._pts[self._n - 1].tolist()
+        if abs(x - last_x) + abs(y - last_y) < _MIN_POINT_SPACING_PX:
+            return
+        self._append_point(x, y)
+        self._stroke_path_layer(self._n - 2)
+        self.update()
 
     def mouseReleaseEvent(self, event):
         if event.button() == Qt.LeftButton:
+            if self.drawing:
+                # re-stroke as one path so the joins are clean
+                self._path_layer.fill(Qt.transparent)
+                self._stroke_path_layer(0)
+                self._update_headings()
             self.drawing = False
 
     # ---------- painting ----------
@@ -141,22 +465,14 @@ class ImageCanvas(QWidget):
         if self.image:
             painter.drawPixmap(0, 0, self.image)
 
-        # Draw the path
-        if len(self.path_points) > 1:
-            pen = QPen(Qt.yellow, 2)
-            painter.setPen(pen)
-            path = QPainterPath(self.path_points[0])
-            for p in self.path_points[1:]:
-                path.lineTo(p)
-            painter.drawPath(path)
+        # Draw the path (stroked once into a cached layer)
+        if self.hasPath() and self._path_layer is not None:
+            painter.drawPixmap(0, 0, self._path_layer)
 
         # Draw drone + red rectangle
         if self.hasPath():
-            idx = max(0, min(self.drone_index, len(self.path_points) - 1))
-            drone_pos = self.path_points[idx]
-            angle_deg = self._heading_angle_deg(idx)
-
-            self._draw_drone_and_rect(painter, drone_pos, angle_deg)
+            idx = max(0, min(self.drone_index, self._n - 1))
+            self._draw_drone_and_rect(painter, idx)
 
     # ---------- helpers ----------
 
@@ -165,12 +481,38 @@ class ImageCanvas(QWidget):
             return False
         return 0 <= p.x() < self.image.width() and 0 <= p.y() < self.image.height()
 
+    def _append_point(self, x: float, y: float):
+        """Append a point to the path, doubling the buffers when full."""
+        if self._n == len(self._pts):
+            grown = np.empty((2 * len(self._pts), 2), dtype=np.float32)
+            grown[:self._n] = self._pts
+            self._pts = grown
+            self._cos = np.resize(self._cos, len(grown))
+            self._sin = np.resize(self._sin, len(grown))
+            self._angle_keys = np.resize(self._angle_keys, len(grown))
+        self._pts[self._n] = (x, y)
+        self._n += 1
+        # the previous last point now has a segment of its own
+        self._n_headings = max(0, min(self._n_headings, self._n - 2))
+
+    def _stroke_path_layer(self, start: int):
+        """Stroke the path from point index `start` onwards into the path layer."""
+        if self._path_layer is None or self._n - start < 2:
+            return
+        painter = QPainter(self._path_layer)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QPen(Qt.yellow, 2))
+        path = QPainterPath()
+        path.addPolygon(QPolygonF([QPointF(x, y) for x, y in self._pts[start:self._n].tolist()]))
+        painter.drawPath(path)
+        painter.end()
+
     def _on_timer(self):
         if not self.hasPath():
             self.stopAnimation()
             return
 
-        if self.drone_index < len(self.path_points) - 1:
+        if self.drone_index < self._n - 1:
             self.drone_index += 1
             self._emit_crop()
             self.update()
@@ -183,75 +525,160 @@ class ImageCanvas(QWidget):
         Create a QPixmap that contains EXACTLY what is inside
         the red rectangle (same size & orientation, like a camera view).
         """
-        if not self.hasImage() or not self.hasPath() or self.image_qimage is None:
+        if not self.hasImage() or not self.hasPath() or self._src_tiles is None:
             return
 
-        idx = max(0, min(self.drone_index, len(self.path_points) - 1))
-        center = self.path_points[idx]
-        angle_deg = self._heading_angle_deg(idx)
-        angle_rad = math.radians(angle_deg)
-
-        cos_t = math.cos(angle_rad)
-        sin_t = math.sin(angle_rad)
+        idx = max(0, min(self.drone_index, self._n - 1))
+        cx, cy = self._pts[idx].tolist()
+        cos_t, sin_t = self._heading(idx)
 
         w = int(self.rect_width_px)
         h = int(self.rect_height_px)
         if w < 2 or h < 2:
             return
 
-        result = QImage(w, h, QImage.Format_ARGB32)
-        result.fill(QColor(0, 0, 0))  # black outside image bounds
-
-        img_w = self.image_qimage.width()
-        img_h = self.image_qimage.height()
-
-        # For each pixel in the camera image, sample the big image
-        for y in range(h):
-            ly = y - h / 2.0
-            for x in range(w):
-                lx = x - w / 2.0
-
-                # local -> world (image) coordinates
-                gx = center.x() + cos_t * lx - sin_t * ly
-                gy = center.y() + sin_t * lx + cos_t * ly
+        # any view still rendering for an earlier tick is now outdated
+        self._view_seq += 1
 
-                ix = int(round(gx))
-                iy = int(round(gy))
-
-                if 0 <= ix < img_w and 0 <= iy < img_h:
-                    result.setPixel(x, y, self.image_qimage.pixel(ix, iy))
-                # else remains black
-
-        pix = QPixmap.fromImage(result)
-        self.cropUpdated.emit(pix)
+        task = self._precompute
+        if task is not None and idx < task.done:
+            self._pending_render = None
+            crop = task.crops[idx]
+            qimg = QImage(crop.data, w, h, 4 * w, QImage.Format_ARGB32)
+            self.cropUpdated.emit(QPixmap.fromImage(qimg))
+            return
 
-    def _heading_angle_deg(self, idx: int) -> float:
-        """Angle in degrees of the path at index idx."""
-        if len(self.path_points) < 2:
-            return 0.0
+        # nearby ticks often land on the same pixel & heading: reuse the view
+        key = (int(cx), int(cy), int(self._angle_keys[idx]))
+        pix = self._crop_cache.get(key)
+        if pix is not None:
+            self._pending_render = None
+            self._crop_cache.move_to_end(key)
+            self.cropUpdated.emit(pix)
+            return
 
-        if idx < len(self.path_points) - 1:
-            p1 = self.path_points[idx]
-            p2 = self.path_points[idx + 1]
-        else:
-            p1 = self.path_points[idx - 1]
-            p2 = self.path_points[idx]
+        self._request_render(self._view_seq, key, cx, cy, cos_t, sin_t)
 
-        dx = p2.x() - p1.x()
-        dy = p2.y() - p1.y()
-        if dx == 0 and dy == 0:
-            return 0.0
+    def _request_render(self, seq, key, cx, cy, cos_t, sin_t):
+        """Render a view off the GUI thread; keep only the newest request while busy."""
+        if self._render_busy:
+            self._pending_render = (seq, key, cx, cy, cos_t, sin_t)
+            return
+        self._render_busy = True
+        task = _CropRender(self._src_tiles, self._src_size, self._out_np,
+                           self._generation, seq, key, cx, cy, cos_t, sin_t)
+        task.signals.rendered.connect(self._on_view_rendered)
+        self._pool.start(task)
+
+    def _on_view_rendered(self, generation, seq, key):
+        self._render_busy = False
+        # views rendered before an image/path/size change are stale; a view
+        # overtaken by a newer tick is still cached but no longer shown
+        if generation == self._generation:
+            h, w = self._out_np.shape[:2]
+            pix = QPixmap.fromImage(self._out_qimg)
+            self._crop_cache[key] = pix
+            limit = max(1, min(_CROP_CACHE_MAX, _CROP_CACHE_BYTES // (4 * w * h)))
+            while len(self._crop_cache) > limit:
+                self._crop_cache.popitem(last=False)
+            if seq == self._view_seq:
+                self.cropUpdated.emit(pix)
+
+        if self._pending_render is not None:
+            request, self._pending_render = self._pending_render, None
+            self._request_render(*request)
+
+    def _start_precompute(self):
+        """Render the whole path's camera views in the background, if they fit."""
+        if self._precompute is not None:
+            return  # still valid: path, image and size changes cancel it
+        w = int(self.rect_width_px)
+        h = int(self.rect_height_px)
+        if self._n * w * h * 4 > _PRECOMPUTE_BYTES:
+            return
+        n = self._n
+        self._update_headings()
+        self._precompute = _PrecomputedCrops(n, w, h)
+        self._pool.start(_CropPrecompute(
+            self._precompute, self._src_tiles, self._src_size, self._pts[:n].copy(),
+            self._cos[:n].copy(), self._sin[:n].copy()))
+
+    def _cancel_background(self):
+        """Drop background results that no longer match the image/path/size."""
+        if self._precompute is not None:
+            self._precompute.cancelled = True
+            self._precompute = None
+        self._pending_render = None
+        self._generation += 1
+
+    def _shutdown_background(self):
+        self._cancel_background()
+        self._pool.waitForDone()
+
+    def _alloc_output_buffer(self):
+        """(Re)allocate the camera-view buffer if the rect size changed."""
+        w = int(self.rect_width_px)
+        h = int(self.rect_height_px)
+        if self._out_np is not None and self._out_np.shape[:2] == (h, w):
+            return
+        self._out_np = np.zeros((h, w, 4), dtype=np.uint8)
+        self._crop_cache.clear()
+        self._cancel_background()
+        # QImage shares memory with _out_np; QPixmap.fromImage copies it out
+        self._out_qimg = QImage(self._out_np.data, w, h, 4 * w, QImage.Format_ARGB32)
+
+    @staticmethod
+    def _qimage_view(qimg: QImage) -> np.ndarray:
+        """
+        (H, W, 4) uint8 view (BGRA byte order) of an ARGB32 QImage's pixels,
+        without copying; only valid while qimg is alive and unchanged.
+        """
+        h, w = qimg.height(), qimg.width()
+        bits = qimg.constBits()
+        bits.setsize(qimg.sizeInBytes())
+        buf = np.frombuffer(bits, dtype=np.uint8)
+        return buf.reshape(h, qimg.bytesPerLine() // 4, 4)[:, :w]
 
-        angle_rad = math.atan2(dy, dx)
-        return math.degrees(angle_rad)
+    def _update_headings(self):
+        """
+        Bring the per-index headings up to date in one NumPy pass over the
+        indices that changed since the last call (all of them after a new
+        path, just the tail while drawing).
+        """
+        n = self._n
+        if self._n_headings >= n:
+            return
+        if n < 2:
+            self._cos[:n] = 1.0
+            self._sin[:n] = 0.0
+            self._angle_keys[:n] = 0
+            self._n_headings = n
+            return
 
-    def _draw_drone_and_rect(self, painter: QPainter, center: QPointF, angle_deg: float):
+        start = min(self._n_headings, n - 2)
+        d = np.diff(self._pts[start:n].astype(np.float64), axis=0)
+        # the last point keeps the heading of the last segment
+        d = np.vstack([d, d[-1:]])
+        # atan2(0, 0) == 0, so zero-length segments point along +x
+        angles = np.arctan2(d[:, 1], d[:, 0])
+        self._cos[start:n] = np.cos(angles)
+        self._sin[start:n] = np.sin(angles)
+        self._angle_keys[start:n] = np.floor(np.degrees(angles) * 4)
+        self._n_headings = n
+
+    def _heading(self, idx: int):
+        """(cos, sin) of the path heading at index idx."""
+        if idx >= self._n_headings:
+            self._update_headings()
+        return float(self._cos[idx]), float(self._sin[idx])
+
+    def _draw_drone_and_rect(self, painter: QPainter, idx: int):
         painter.save()
 
         # Move and rotate coordinate system to drone center
-        transform = QTransform()
-        transform.translate(center.x(), center.y())
-        transform.rotate(angle_deg)
+        cx, cy = self._pts[idx].tolist()
+        cos_t, sin_t = self._heading(idx)
+        transform = QTransform(cos_t, sin_t, -sin_t, cos_t, cx, cy)
         painter.setTransform(transform, True)
 
         # Drone icon: small triangle
@@ -427,9 +854,18 @@ class MainWindow(QMainWindow):
     def update_preview(self, pixmap: QPixmap):
         if pixmap.isNull():
             return
+        target = self.preview_label.size()
+        # Much bigger than the label: cheap nearest-neighbour pass down to
+        # ~2x the label first, so the smooth filter cost stays bounded
+        if pixmap.width() > 2 * target.width() or pixmap.height() > 2 * target.height():
+            pixmap = pixmap.scaled(
+                2 * target,
+                Qt.KeepAspectRatio,
+                Qt.FastTransformation,
+            )
         # Scale to fit preview label (camera view)
         scaled = pixmap.scaled(
-            self.preview_label.size(),
+            target,
             Qt.KeepAspectRatio,
             Qt.SmoothTransformation,
         )